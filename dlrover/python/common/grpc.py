@@ -11,12 +11,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
+import builtins
+import io
+import json
 import pickle
 import random
 import socket
+import sys
+import threading
 from contextlib import closing
-from dataclasses import dataclass, field
-from typing import Dict, List
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, List, Tuple
+from urllib.parse import urlsplit
 
 import grpc
 
@@ -26,42 +34,108 @@ from dlrover.python.common.serialize import JsonSerializable
 
 TIMEOUT_SEC = 5
 
+# The retry policy applies to all methods of the service.
+_GRPC_SERVICE_CONFIG = {
+    "methodConfig": [
+        {
+            "name": [{}],
+            "retryPolicy": {
+                "maxAttempts": 5,
+                "initialBackoff": "0.2s",
+                "maxBackoff": "3s",
+                "backoffMultiplier": 2,
+                "retryableStatusCodes": ["UNAVAILABLE"],
+            },
+        }
+    ]
+}
+
+_GRPC_CHANNEL_OPTIONS = (
+    ("grpc.max_send_message_length", GRPC.MAX_SEND_MESSAGE_LENGTH),
+    ("grpc.max_receive_message_length", GRPC.MAX_RECEIVE_MESSAGE_LENGTH),
+    ("grpc.enable_retries", True),
+    ("grpc.service_config", json.dumps(_GRPC_SERVICE_CONFIG)),
+)
+
+
+class _SharedChannel(object):
+    """A channel shared by all clients of the same address. The channel
+    is closed after all clients have released it."""
+
+    def __init__(self, addr, channel: grpc.Channel):
+        self.addr = addr
+        self.channel = channel
+        self.ref_count = 0
+
+
+# Reuse channels to avoid the channel initialization and the subchannel
+# discovery per client of the same address.
+_channel_lock = threading.Lock()
+_channels: Dict[str, _SharedChannel] = {}
+_channel_refs: Dict[int, _SharedChannel] = {}
+
 
 def build_channel(addr):
+    """Build a channel to the address. Return None if the address is
+    not reachable. The channel is shared with other clients of the
+    same address and must be released by `close_channel`.
+    """
+    addr = addr.strip()
     if not addr_connected(addr):
+        with _channel_lock:
+            # The stale channel is closed after all clients release it.
+            _channels.pop(addr, None)
         return None
-    channel = grpc.insecure_channel(
-        addr,
-        options=[
-            ("grpc.max_send_message_length", GRPC.MAX_SEND_MESSAGE_LENGTH),
-            (
-                "grpc.max_receive_message_length",
-                GRPC.MAX_RECEIVE_MESSAGE_LENGTH,
-            ),
-            ("grpc.enable_retries", True),
-            (
-                "grpc.service_config",
-                """{ "retryPolicy":{ "maxAttempts": 5, \n
-"initialBackoff": "0.2s", \n
-"maxBackoff": "3s", "backoffMutiplier": 2, \n
-"retryableStatusCodes": [ "UNAVAILABLE" ] } }""",
-            ),
-        ],
-    )
-    return channel
+    with _channel_lock:
+        shared = _channels.get(addr, None)
+        if shared is None:
+            channel = _new_insecure_channel(addr)
+            shared = _SharedChannel(addr, channel)
+            _channels[addr] = shared
+            _channel_refs[id(channel)] = shared
+        shared.ref_count += 1
+        return shared.channel
+
+
+def _new_insecure_channel(addr):
+    return grpc.insecure_channel(addr, options=_GRPC_CHANNEL_OPTIONS)
+
+
+def close_channel(channel: grpc.Channel):
+    """Release the channel built by `build_channel`. The channel is
+    closed when no client holds it."""
+    with _channel_lock:
+        shared = _channel_refs.get(id(channel), None)
+        if shared is None:
+            return
+        shared.ref_count -= 1
+        if shared.ref_count > 0:
+            return
+        _channel_refs.pop(id(channel))
+        if _channels.get(shared.addr, None) is shared:
+            _channels.pop(shared.addr)
+    shared.channel.close()
+
+
+def parse_host_port(addr):
+    """Parse the host and port from the address like "localhost:5000"
+    or "[::1]:5000" with an IPv6 host."""
+    try:
+        url = urlsplit("//" + addr)
+        return url.hostname, url.port
+    except ValueError:
+        return None, None
 
 
 def addr_connected(addr):
     addr = addr.strip()
     if not addr:
         return False
-    host_port = addr.split(":")
-    if len(host_port) != 2:
+    host, port = parse_host_port(addr)
+    if not host or port is None:
         return False
-    host = host_port[0]
-    port = int(host_port[1])
     try:
-        with socket.create_connection((host, port), timeout=5):
+        with socket.create_connection((host, port), timeout=TIMEOUT_SEC):
             return True
     except OSError:
         logger.warning(f"Service {addr} is not connected.")
@@ -112,6 +186,24 @@ def grpc_server_ready(channel) -> bool:
         return False
 
 
+class _MessageUnpickler(pickle.Unpickler):
+    """The unpickler only loads the messages in this module and the
+    builtin types to avoid executing any code from the pickle data."""
+
+    _builtins = {"bytearray", "complex", "frozenset", "range", "set", "slice"}
+
+    def find_class(self, module, name):
+        if module == __name__:
+            cls = globals().get(name, None)
+            if isinstance(cls, type) and issubclass(cls, Message):
+                return cls
+        elif module == "builtins" and name in self._builtins:
+            return getattr(builtins, name)
+        elif module == "array" and name in ("array", "_array_reconstructor"):
+            return getattr(array, name)
+        raise pickle.UnpicklingError(f"Forbidden to load {module}.{name}.")
+
+
 def deserialize_message(data: bytes):
     """The method will create a message instance with the content.
     Args:
@@ -120,31 +212,111 @@ def deserialize_message(data: bytes):
     message = None
     if data:
         try:
-            message = pickle.loads(data)
+            message = _MessageUnpickler(io.BytesIO(data)).load()
         except Exception as e:
-            logger.warning(f"Pickle failed to load {str(data)}", e)
+            logger.warning(f"Pickle failed to load {data!r}: {e}")
     return message
 
 
+if TYPE_CHECKING:
+    # The type checker cannot see the fields and the `__init__` of
+    # the dataclass through the custom decorator.
+    from dataclasses import dataclass as message_dataclass
+else:
+
+    def message_dataclass(cls):
+        """Create a dataclass with `__slots__`. Messages are created for
+        each RPC and the slots save the `__dict__` of each instance.
+        """
+        if sys.version_info >= (3, 10):
+            slots_cls = dataclass(slots=True)(cls)
+        else:
+            slots_cls = _add_slots(dataclass(cls))
+        # Cache the field names and the getter of field values for
+        # `__reduce__` and `to_dict` of the message.
+        field_names = tuple(f.name for f in fields(slots_cls))
+        slots_cls._field_names = field_names
+        slots_cls._get_field_values = staticmethod(
+            _new_field_values_getter(field_names)
+        )
+        return slots_cls
+
+
+def _new_field_values_getter(field_names):
+    """Return a function to get the tuple of field values by
+    `attrgetter` which gets all fields in one C call."""
+    if len(field_names) == 0:
+        return lambda obj: ()
+    elif len(field_names) == 1:
+        getter = attrgetter(field_names[0])
+        return lambda obj: (getter(obj),)
+    return attrgetter(*field_names)
+
+
+def _add_slots(cls):
+    inherited_slots = set()
+    for base in cls.__mro__[1:-1]:
+        inherited_slots.update(getattr(base, "__slots__", ()))
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = tuple(
+        name for name in field_names if name not in inherited_slots
+    )
+    for name in field_names:
+        # Remove the default values which conflict with the slots.
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    slots_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slots_cls.__qualname__ = cls.__qualname__
+    return slots_cls
+
+
 class Message(JsonSerializable):
+    __slots__ = ()
+    _field_names: Tuple[str, ...] = ()
+    _get_field_values = staticmethod(_new_field_values_getter(()))
+
+    def __reduce__(self):
+        # Pickle the field values in the order of the dataclass fields
+        # instead of the generic state of slots which is bigger and
+        # slower to pickle.
+        return (self.__class__, self._get_field_values(self))
+
+    def __setstate__(self, state):
+        # The message pickled by the peer of an old version which has
+        # no `__reduce__` carries the `__dict__` of the message, or the
+        # tuple of `__dict__` and the slots state.
+        if isinstance(state, tuple):
+            dict_state, slots_state = state
+            state = dict(dict_state or {})
+            state.update(slots_state or {})
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def to_dict(self):
+        return dict(zip(self._field_names, self._get_field_values(self)))
+
     def serialize(self):
-        return pickle.dumps(self)
+        # The protocol 5 is supported from Python 3.8 and it pickles
+        # large bytes buffers with less copies.
+        return pickle.dumps(self, protocol=5)
 
 
-@dataclass
+@message_dataclass
 class TaskRequest(Message):
     dataset_name: str = ""
 
 
-@dataclass
+@message_dataclass
 class Shard(Message):
     name: str = ""
     start: int = 0
     end: int = 0
-    indices: List[int] = field(default_factory=list)
+    indices: array.array = field(default_factory=lambda: array.array("q"))
 
 
-@dataclass
+@message_dataclass
 class Task(Message):
     task_id: int = 0
     shard: Shard = Shard()
@@ -152,7 +324,7 @@ class Task(Message):
     extended_config: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@message_dataclass
 class GPUStats(Message):
     index: int = 0
     total_memory_mb: int = 0
@@ -160,7 +332,7 @@ class GPUStats(Message):
     gpu_utilization: float = 0
 
 
-@dataclass
+@message_dataclass
 class TensorStats(Message):
     """TensorStats contains tensor statistics of a deep learning model"""
 
@@ -170,7 +342,7 @@ class TensorStats(Message):
     kv_embedding_dims: List[int] = field(default_factory=list)
 
 
-@dataclass
+@message_dataclass
 class OpStats(Message):
     """TensorStats contains OP statistics of a deep learning model"""
 
@@ -181,7 +353,7 @@ class OpStats(Message):
     flops: int = 0
 
 
-@dataclass
+@message_dataclass
 class ModelInfo(Message):
     """ModelInfo contains profiling data of a model."""
 
@@ -191,26 +363,26 @@ class ModelInfo(Message):
     activation_memory: int = 0
 
 
-@dataclass
+@message_dataclass
 class ResourceStats(Message):
     memory: int = 0  # unit Byte.
     cpu: float = 0.0
     gpu_stats: List[GPUStats] = field(default_factory=list)
 
 
-@dataclass
+@message_dataclass
 class GlobalStep(Message):
     timestamp: int = 0
     step: int = 1
     elapsed_time_per_step: float = 0.0
 
 
-@dataclass
+@message_dataclass
 class HeartBeat(Message):
     timestamp: int = 0
 
 
-@dataclass
+@message_dataclass
 class DatasetShardParams(Message):
     batch_size: int = 0
     num_epochs: int = 0
@@ -222,17 +394,17 @@ class DatasetShardParams(Message):
     storage_type: str = ""
 
 
-@dataclass
+@message_dataclass
 class ShardCheckpointRequest(Message):
     dataset_name: str = ""
 
 
-@dataclass
+@message_dataclass
 class ShardCheckpoint(Message):
     content: str = ""
 
 
-@dataclass
+@message_dataclass
 class TaskResult(Message):
     dataset_name: str = ""
     task_id: int = 0  # Task id assigned by master.
@@ -242,40 +414,40 @@ class TaskResult(Message):
     exec_counters: Dict[str, int] = field(default_factory=dict)
 
 
-@dataclass
+@message_dataclass
 class SyncJoin(Message):
     sync_name: str = ""
 
 
-@dataclass
+@message_dataclass
 class SyncFinish(Message):
     sync_name: str = ""
 
 
-@dataclass
+@message_dataclass
 class SyncBarrier(Message):
     barrier_name: str = ""
     notify: bool = False
 
 
-@dataclass
+@message_dataclass
 class PsReady(Message):
     pass
 
 
-@dataclass
+@message_dataclass
 class ClusterVersionRequest(Message):
     task_type: str = ""  # TF job type PS/worker
     task_id: int = 0
     version_type: str = ""
 
 
-@dataclass
+@message_dataclass
 class ClusterVersion(ClusterVersionRequest):
     version: int = 0
 
 
-@dataclass
+@message_dataclass
 class NodeMeta(Message):
     type: str = ""
     addr: str = ""
@@ -289,29 +461,29 @@ class NodeMeta(Message):
 
 
 class NodeAddress(NodeMeta):
-    pass
+    __slots__ = ()
 
 
-@dataclass
+@message_dataclass
 class NetworkStatus(NodeMeta):
     elasped_time: float = 0.0
 
 
-@dataclass
+@message_dataclass
 class NodeEvent(Message):
     event_type: str = ""
     message: str = ""
     node: NodeMeta = NodeMeta()
 
 
-@dataclass
+@message_dataclass
 class NodeFailure(Message):
     error_data: str = ""
     restart_count: int = 0
     level: str = ""
 
 
-@dataclass
+@message_dataclass
 class RendezvousParams(Message):
     min_nodes: int = 0
     max_nodes: int = 0
@@ -319,46 +491,46 @@ class RendezvousParams(Message):
     node_unit: int = 0
 
 
-@dataclass
+@message_dataclass
 class RendezvousRequest(Message):
     node_id: int = 0
     local_world_size: int = 0
     rdzv_name: str = ""
 
 
-@dataclass
+@message_dataclass
 class CommWorldRequest(RendezvousRequest):
     pass
 
 
-@dataclass
+@message_dataclass
 class JoinRendezvousRequest(RendezvousRequest):
     node_rank: int = -1
     node_ip: str = ""  # The IP of node where the pod is located.
 
 
-@dataclass
+@message_dataclass
 class WaitingNodeNumRequest(RendezvousRequest):
     pass
 
 
-@dataclass
+@message_dataclass
 class NetworkReadyRequest(Message):
     pass
 
 
-@dataclass
+@message_dataclass
 class StragglerExistRequest(Message):
     pass
 
 
-@dataclass
+@message_dataclass
 class NetworkCheckResult(Message):
     nodes: List[int] = field(default_factory=list)
     reason: str = ""
 
 
-@dataclass
+@message_dataclass
 class RendezvousState(Message):
     world: Dict[int, int] = field(default_factory=dict)
     waiting_num: int = 0
@@ -366,45 +538,45 @@ class RendezvousState(Message):
     group: int = 0
 
 
-@dataclass
+@message_dataclass
 class PsNodesRequest(Message):
     pass
 
 
-@dataclass
+@message_dataclass
 class PsNodes(Message):
     nodes: List[NodeMeta] = field(default_factory=list)
     new_ps_ready: bool = False
     ps_failure: bool = False
 
 
-@dataclass
+@message_dataclass
 class TrainingStatusRequest(Message):
     pass
 
 
-@dataclass
+@message_dataclass
 class TrainingStatus(Message):
     status: int = 0
 
 
-@dataclass
+@message_dataclass
 class RunningNodesRequest(Message):
     pass
 
 
-@dataclass
+@message_dataclass
 class RunningNodes(Message):
     nodes: List[NodeMeta] = field(default_factory=list)
 
 
-@dataclass
+@message_dataclass
 class KeyValuePair(Message):
     key: str = ""
     value: bytes = b""
 
 
-@dataclass
+@message_dataclass
 class DataLoaderConfig(Message):
     """The configured parameters of DataLoader.
     Attr:
@@ -424,7 +596,7 @@ class DataLoaderConfig(Message):
     pin_memory: int = 0
 
 
-@dataclass
+@message_dataclass
 class OptimizerConfig(Message):
     version: int = 0
     optimizer_name: str = ""
@@ -432,38 +604,38 @@ class OptimizerConfig(Message):
     weight_decay: float = 0.0
 
 
-@dataclass
+@message_dataclass
 class ParallelConfigRequest(Message):
     pass
 
 
-@dataclass
+@message_dataclass
 class CheckHardwareResetRequest(Message):
     pass
 
 
-@dataclass
+@message_dataclass
 class ParallelConfig(Message):
     dataloader: DataLoaderConfig = DataLoaderConfig()
     optimizer: OptimizerConfig = OptimizerConfig()
     restart: bool = False
 
 
-@dataclass
+@message_dataclass
 class NodeCheckpointState(Message):
     step: int = 0
 
 
-@dataclass
+@message_dataclass
 class DiagnosisTrainingLog(Message):
     timestamp: int = 0
 
 
-@dataclass
+@message_dataclass
 class DiagnosisCudaLog(Message):
     timestamp: int = 0
 
 
-@dataclass
+@message_dataclass
 class DiagnosisChipMetrics(Message):
     timestamp: int = 0
@@ -11,14 +11,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
 import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 from typing import Dict
 
+try:
+    # pybase64 uses SIMD kernels and is much faster on large payloads.
+    import pybase64 as base64
+except ImportError:
+    import base64  # type: ignore
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 def to_dict(o):
-    if hasattr(o, "to_dict"):
+    if isinstance(o, bytes):
+        return base64.b64encode(o).decode("utf-8")
+    elif isinstance(o, array.array):
+        return o.tolist()
+    elif hasattr(o, "to_dict"):
         return o.to_dict()
+    elif is_dataclass(o) and not hasattr(o, "__dict__"):
+        # The dataclass with slots has no `__dict__`.
+        return {f.name: getattr(o, f.name) for f in fields(o)}
     elif hasattr(o, "__dict__"):
         return o.__dict__
     else:
@@ -26,7 +45,21 @@ def to_dict(o):
 
 
 class JsonSerializable(object):
+    __slots__ = ()
+
     def to_json(self, indent=None):
+        if orjson is not None and indent in (None, 2):
+            option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(
+                    self, default=to_dict, option=option
+                ).decode("utf-8")
+            except TypeError:
+                # orjson does not support some values like integers
+                # beyond 64 bits and the json module can dump them.
+                pass
         return json.dumps(
             self,
             default=to_dict,
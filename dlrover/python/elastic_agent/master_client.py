@@ -82,14 +82,15 @@ class MasterClient(Singleton):
         self._ddp_server_port = self.find_free_port()
 
     def __del__(self):
-        if self._channel:
-            self._channel.close()
+        self.close_channel()
 
     def close_channel(self):
         if self._channel:
-            self._channel.close()
+            grpc.close_channel(self._channel)
+            self._channel = None
 
     def open_channel(self):
+        self.close_channel()
         self._channel = grpc.build_channel(self._master_addr)
         self._stub = elastic_training_pb2_grpc.MasterStub(self._channel)
 
@@ -102,20 +103,24 @@ class MasterClient(Singleton):
             _, port = sock.getsockname()
             return port
 
+    def _to_wire_message(self, message: grpc.Message):
+        """Wrap the message into a gRPC request. The pickled bytes are
+        carried by the bytes field directly without any text encoding
+        which is only used by `to_json` for logs."""
+        return elastic_training_pb2.Message(
+            node_id=self._node_id,
+            node_type=self._node_type,
+            data=message.serialize(),
+        )
+
     @retry_grpc_request
     def _report(self, message: grpc.Message):
-        request = elastic_training_pb2.Message()
-        request.node_id = self._node_id
-        request.node_type = self._node_type
-        request.data = message.serialize()
+        request = self._to_wire_message(message)
         return self._stub.report(request, timeout=self._timeout)
 
     @retry_grpc_request
     def _get(self, message: grpc.Message):
-        request = elastic_training_pb2.Message()
-        request.node_id = self._node_id
-        request.node_type = self._node_type
-        request.data = message.serialize()
+        request = self._to_wire_message(message)
         response = self._stub.get(request, timeout=self._timeout)
         res_message = grpc.deserialize_message(response.data)
         return res_message
@@ -13,11 +13,12 @@
 
 import copy
 import os
+import random
 import threading
 import time
 import traceback
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from dlrover.python.common.constants import (
     DistributionStrategy,
@@ -83,6 +84,15 @@ from dlrover.python.scheduler.job import ElasticJob, JobArgs
 _dlrover_context = Context.singleton_instance()
 
 _MAX_POD_RELAUNCH_COUNT = 5
+_WATCH_RETRY_BASE_SECS = 5
+_WATCH_RETRY_MAX_SECS = 300
+
+
+def _get_watch_retry_interval(retry_count):
+    """Get the exponential backoff interval with a jitter to watch nodes
+    again after failures."""
+    interval = _WATCH_RETRY_BASE_SECS * 2 ** min(retry_count, 6)
+    return min(_WATCH_RETRY_MAX_SECS, interval) + random.random()
 
 
 class DistributedJobManager(JobManager):
@@ -168,6 +178,7 @@ class DistributedJobManager(JobManager):
 
         self._elastic_job: ElasticJob = job
         self._node_watcher = node_watcher
+        self._job_autoscaler: Optional[JobAutoScaler] = None
 
         self._scaler_watcher = new_scale_plan_watcher(
             job_args.platform,
@@ -317,7 +328,7 @@ class DistributedJobManager(JobManager):
         self._evaluator_manager.update_nodes(evaluators)
 
     def _init_job_auto_scaler(self):
-        self._job_autoscaler: JobAutoScaler = new_job_auto_scaler(
+        self._job_autoscaler = new_job_auto_scaler(
             self._job_args.distribution_strategy,
             self._job_resource,
             self._job_nodes,
@@ -333,6 +344,7 @@ class DistributedJobManager(JobManager):
 
     def _monitor_nodes(self):
         logger.info("Start monitoring nodes events.")
+        retry_count = 0
         while True:
             try:
                 nodes = self._node_watcher.list()
@@ -347,9 +359,11 @@ class DistributedJobManager(JobManager):
                         logger.warning(e)
                         detail_trace_back = traceback.format_exc()
                         logger.warning(detail_trace_back)
+                retry_count = 0
             except Exception as e:
                 logger.warning(e)
-                time.sleep(30)
+                retry_count += 1
+                time.sleep(_get_watch_retry_interval(retry_count))
             time.sleep(5)
 
     def _monitor_node_heart_beat(self):
@@ -426,11 +440,13 @@ class DistributedJobManager(JobManager):
         """Callback with node list by the list api of k8s."""
         if not nodes:
             return
-        exist_nodes: Dict[str, List[int]] = {}
+        exist_nodes: Dict[str, Set[int]] = {}
         for node_type in self._job_nodes.keys():
-            exist_nodes[node_type] = []
+            exist_nodes[node_type] = set()
         for node in nodes:
-            exist_nodes[node.type].append(node.id)
+            exist_nodes[node.type].add(node.id)
+            if not self._is_listed_node_changed(node):
+                continue
             if node.status == NodeStatus.DELETED:
                 type = NodeEventType.DELETED
             else:
@@ -459,6 +475,29 @@ class DistributedJobManager(JobManager):
                     event = NodeEvent(NodeEventType.DELETED, new_node)
                     self._process_event(event)
 
+    def _is_listed_node_changed(self, node: Node):
+        """Check whether the listed node differs from the node of the job.
+        The mock event of an unchanged node takes no effect."""
+        cur_node = self._job_nodes[node.type].get(node.id, None)
+        if cur_node is None:
+            return True
+        return (
+            node.status != cur_node.status
+            or (node.name is not None and node.name != cur_node.name)
+            or (
+                node.start_time is not None
+                and node.start_time != cur_node.start_time
+            )
+            or (
+                node.create_time is not None
+                and node.create_time != cur_node.create_time
+            )
+            or (node.host_name and node.host_name != cur_node.host_name)
+            or (node.host_ip and node.host_ip != cur_node.host_ip)
+            or node.restart_training != cur_node.restart_training
+            or node.relaunch_count > cur_node.relaunch_count
+        )
+
     def close_job(self):
         plan = ScalePlan()
         ps_resource = NodeGroupResource.new_empty()
@@ -510,8 +549,12 @@ class DistributedJobManager(JobManager):
             cur_node.update_status(new_status)
             new_status = status_change_flow.to_status
             cur_node.set_exit_reason(event.node.exit_reason)
-            self._process_node_events(status_change_flow, cur_node)
 
+        # Callbacks may be slow and run out of the lock to not block
+        # the events of other nodes.
+        self._process_node_events(status_change_flow, cur_node)
+
+        with self._lock:
             should_relaunch = self._should_relaunch(
                 cur_node, status_change_flow
             )
@@ -528,35 +571,31 @@ class DistributedJobManager(JobManager):
 
         if should_relaunch:
             self._relaunch_node(cur_node)
+        # Wake up the auto-scaler after the relaunch so it does not
+        # count the failed node as a lost node to scale up.
+        if self._job_autoscaler:
+            self._job_autoscaler.notify_node_changed()
 
     def _process_node_events(
         self, status_change_flow: NodeStateFlow, node: Node
     ):
         cluster_context = ClusterContext(job_manager=self)
         if status_change_flow.to_status == NodeStatus.RUNNING:
-            [
+            for callback in self._node_event_callbacks:
                 callback.on_node_started(node, cluster_context)
-                for callback in self._node_event_callbacks
-            ]
         elif status_change_flow.to_status == NodeStatus.SUCCEEDED:
-            [
+            for callback in self._node_event_callbacks:
                 callback.on_node_succeeded(node, cluster_context)
-                for callback in self._node_event_callbacks
-            ]
         elif status_change_flow.to_status == NodeStatus.FAILED:
-            [
+            for callback in self._node_event_callbacks:
                 callback.on_node_failed(node, cluster_context)
-                for callback in self._node_event_callbacks
-            ]
         elif (
             status_change_flow.from_status != NodeStatus.FAILED
             and status_change_flow.from_status != NodeStatus.SUCCEEDED
             and status_change_flow.to_status == NodeStatus.DELETED
         ):
-            [
+            for callback in self._node_event_callbacks:
                 callback.on_node_deleted(node, cluster_context)
-                for callback in self._node_event_callbacks
-            ]
 
     def _should_relaunch(self, node: Node, status_change_flow: NodeStateFlow):
         should_relaunch = (
@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import threading
 import time
 from abc import ABCMeta, abstractmethod
@@ -91,10 +92,25 @@ class JobAutoScaler(metaclass=ABCMeta):
 
         self._suggested_stop = False
         self._autoscaling_started = False
+        # Wake up the auto-scaling thread before the interval elapses
+        # if the status of nodes changes or auto-scaling stops.
+        self._wakeup_event = threading.Event()
 
     def suggested_stop(self):
         return self._suggested_stop
 
+    def notify_node_changed(self):
+        """Notify the auto-scaling thread that the status of nodes
+        changes to check the job resource in time."""
+        self._wakeup_event.set()
+
+    def _wait_for_wakeup(self):
+        """Wait until the thread is woken up or the scale interval
+        elapses."""
+        woken = self._wakeup_event.wait(self._scale_interval)
+        self._wakeup_event.clear()
+        return woken
+
     @abstractmethod
     def start_auto_scaling(self):
         """Start auto-scaling nodes of a job"""
@@ -108,7 +124,8 @@ class JobAutoScaler(metaclass=ABCMeta):
     @abstractmethod
     def execute_job_optimization_plan(self, plan: ResourcePlan):
         """Scale nodes of a job by a ResourcePlan"""
-        logger.info(f"Execute job optimization plan: {plan.to_json()}.")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Execute job optimization plan: %s.", plan.to_json())
 
 
 class PSTrainingAutoScaler(JobAutoScaler):
@@ -134,6 +151,7 @@ class PSTrainingAutoScaler(JobAutoScaler):
         )
         self._ps_manager = ps_manager
         self._worker_manager = worker_manager
+        self._autoscaling_start_event = threading.Event()
         threading.Thread(
             target=self.monitor_pending_node_at_begining,
             name="monitor_pending_nodes",
@@ -148,13 +166,14 @@ class PSTrainingAutoScaler(JobAutoScaler):
                 break
             plan = self._reduce_timeout_pending_node_resource()
             self._scaler.scale(plan)
-            time.sleep(self._scale_interval * 2)
+            self._autoscaling_start_event.wait(self._scale_interval * 2)
 
     def start_auto_scaling(self):
         """Start to auto-scale nodes to improve the training throughput."""
         if not self._autoscaling_started:
             logger.info("AutoScaling started!")
             self._autoscaling_started = True
+            self._autoscaling_start_event.set()
             if (
                 not _dlrover_context.auto_ps_enabled
                 and not _dlrover_context.auto_worker_enabled
@@ -173,6 +192,7 @@ class PSTrainingAutoScaler(JobAutoScaler):
 
     def stop_auto_scaling(self):
         self._autoscaling_started = False
+        self._wakeup_event.set()
 
     def _periodic_optimize_running_resource(self):
         """Adjust job resource periodically and stop adjustment
@@ -195,7 +215,7 @@ class PSTrainingAutoScaler(JobAutoScaler):
                 if plan:
                     last_plan_time = time.time()
                 self.execute_job_optimization_plan(plan)
-            time.sleep(self._scale_interval)
+            self._wait_for_wakeup()
 
     def execute_job_optimization_plan(self, plan: ResourcePlan):
         """Execute the optimization plan of the training job.
@@ -208,13 +228,12 @@ class PSTrainingAutoScaler(JobAutoScaler):
             return scale_plan
         for node_type, group in plan.node_group_resources.items():
             if group.count > 0:
-                self._job_resource.update_node_group_resource(
+                group = self._job_resource.update_node_group_resource(
                     node_type,
                     group.count,
                     group.node_resource.cpu,
                     group.node_resource.memory,
                 )
-                group = self._job_resource.get_node_group_resource(node_type)
                 if node_type == NodeType.PS:
                     ps_plan = self._ps_manager.adjust_ps(group)
                     scale_plan.merge(ps_plan)
@@ -252,7 +271,8 @@ class PSTrainingAutoScaler(JobAutoScaler):
         if len(workers) > 0:
             plan = self._worker_manager.migrate_workers(workers)
             scale_plan.merge(plan)
-        logger.info("Migration plan = %s", scale_plan.to_json())
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Migration plan = %s", scale_plan.to_json())
         return scale_plan
 
     def _reduce_timeout_pending_node_resource(self):
@@ -304,15 +324,16 @@ class AllreduceTrainingAutoScaler(JobAutoScaler):
 
     def stop_auto_scaling(self):
         self._autoscaling_started = False
+        self._wakeup_event.set()
 
     def _periodic_adjust_worker(self):
         """Periodicaly adjust the number of worker."""
         logger.info("Start auto-scaling thread for AllReduce Training.")
         while True:
+            self._wait_for_wakeup()
             if not self._autoscaling_started:
                 logger.info("Stop auto-scaling thread for AllReduce Training.")
                 break
-            time.sleep(self._scale_interval)
             alive_num = self._get_alive_worker_num()
             self._job_optimizer.set_alive_node_num(alive_num)
             plan = self._job_optimizer.get_job_resource_plan()
@@ -346,13 +367,12 @@ class AllreduceTrainingAutoScaler(JobAutoScaler):
             if node_type != NodeType.WORKER:
                 continue
             if group.count > 0:
-                self._job_resource.update_node_group_resource(
+                group = self._job_resource.update_node_group_resource(
                     node_type,
                     group.count,
                     group.node_resource.cpu,
                     group.node_resource.memory,
                 )
-                group = self._job_resource.get_node_group_resource(node_type)
                 self._speed_monitor.set_target_worker_num(group.count)
                 worker_plan = self._worker_manager.adjust_worker(group)
                 scale_plan.merge(worker_plan)
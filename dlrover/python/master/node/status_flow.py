@@ -24,7 +24,7 @@ NodeStateFlow = namedtuple(
 The DAG for the state machine is in the issue
 https://github.com/sql-machine-learning/dlrover/issues/2395#issue-753964852
 """
-NODE_STATE_FLOWS = [
+NODE_STATE_FLOWS = (
     NodeStateFlow(
         from_status=NodeStatus.INITIAL,
         to_status=NodeStatus.PENDING,
@@ -116,7 +116,30 @@ NODE_STATE_FLOWS = [
         phase=None,
         should_relaunch=False,
     ),
-]
+)
+
+
+def _build_state_flow_table(flows):
+    """Index the flows by the status and the event type. A flow with the
+    phase None matches any phase and shadows the later flows with the
+    same status and event type."""
+    phase_flows = {}
+    any_phase_flows = {}
+    for flow in flows:
+        for event_type in flow.event_type:
+            key = (flow.from_status, event_type)
+            if key in any_phase_flows:
+                continue
+            if flow.phase is None:
+                any_phase_flows[key] = flow
+            else:
+                phase_flows.setdefault(key + (flow.phase,), flow)
+    return phase_flows, any_phase_flows
+
+
+_PHASE_STATE_FLOWS, _ANY_PHASE_STATE_FLOWS = _build_state_flow_table(
+    NODE_STATE_FLOWS
+)
 
 
 def get_node_state_flow(from_status, event_type, phase):
@@ -125,12 +148,8 @@ def get_node_state_flow(from_status, event_type, phase):
         phase = NodeStatus.DELETED
     if from_status == phase:
         return None
-    for flow in NODE_STATE_FLOWS:
-        if (
-            from_status == flow.from_status
-            and event_type in flow.event_type
-            and (flow.phase is None or phase == flow.phase)
-        ):
-            return flow
-
-    return None
+    key = (from_status, event_type)
+    flow = _PHASE_STATE_FLOWS.get(key + (phase,), None)
+    if flow is None:
+        flow = _ANY_PHASE_STATE_FLOWS.get(key, None)
+    return flow
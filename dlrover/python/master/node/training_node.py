@@ -58,11 +58,13 @@ def set_critical_node(
             if node.critical:
                 node.max_relaunch_count = ps_relaunch_max_num
     if NodeType.WORKER in job_nodes:
-        for i, node in job_nodes[NodeType.WORKER].items():
-            if node.id not in critical_worker_index:
+        workers = job_nodes[NodeType.WORKER]
+        for i, relaunch_count in critical_worker_index.items():
+            worker = workers.get(i, None)
+            if worker is None:
                 continue
-            node.critical = True
-            node.max_relaunch_count = critical_worker_index[i]
+            worker.critical = True
+            worker.max_relaunch_count = relaunch_count
     if NodeType.EVALUATOR in job_nodes:
         for node in job_nodes[NodeType.EVALUATOR].values():
             node.critical = True
@@ -84,17 +84,18 @@ class JobResource(JsonSerializable):
         return list(self.node_group_resources.keys())
 
     def update_node_group_resource(self, node_type, num, cpu, memory):
-        self.node_group_resources.setdefault(
+        """Update the resource of the node group and return the group."""
+        resource = self.node_group_resources.setdefault(
             node_type,
             NodeGroupResource(
                 count=0,
                 node_resource=NodeResource(0, 0),
             ),
         )
-        resource = self.node_group_resources[node_type]
         resource.count = num or resource.count
         resource.node_resource.cpu = cpu or resource.node_resource.cpu
         resource.node_resource.memory = memory or resource.node_resource.memory
+        return resource
 
     @property
     def worker_num(self):
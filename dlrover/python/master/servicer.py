@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
 import threading
 import time
 from concurrent import futures
@@ -65,6 +66,16 @@ except ImportError:
 
 _dlrover_context = Context.singleton_instance()
 _DEFAULT_NUM_MINIBATCHES_PER_SHARD = 100
+_INT32_MAX = 2**31 - 1
+
+
+def _pack_record_indices(record_indices: List[int]):
+    """Pack indices into an array which is pickled as one buffer. Use
+    32-bit items if possible to keep the payload smaller than a list."""
+    typecode = "i" if max(record_indices) <= _INT32_MAX else "q"
+    return array.array(typecode, record_indices)
+
+
 ray_event_queue = RayEventQueue.singleton_instance()
 
 
@@ -155,7 +166,9 @@ class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
             res.shard.start = task.shard.start
             res.shard.end = task.shard.end
             if task.shard.record_indices:
-                res.shard.indices = task.shard.record_indices
+                res.shard.indices = _pack_record_indices(
+                    task.shard.record_indices
+                )
         elif not dataset.completed():
             res.type = elastic_training_pb2.WAIT
         with self._lock:
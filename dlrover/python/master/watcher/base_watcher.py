@@ -20,6 +20,8 @@ from dlrover.python.common.node import Node
 class NodeEvent(object):
     """NodeEvent is the event to change the status of a Node"""
 
+    __slots__ = ("event_type", "node")
+
     def __init__(self, event_type, node):
         self.event_type = event_type
         self.node: Node = node
@@ -11,16 +11,43 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
+import base64
+import json
+import os
+import pickle
 import socket
+import subprocess
+import sys
+import types
 import unittest
+from concurrent import futures
+from unittest import mock
 
+import grpc
+
+import dlrover
+from dlrover.python.common import serialize
 from dlrover.python.common.grpc import (
+    _GRPC_CHANNEL_OPTIONS,
+    TIMEOUT_SEC,
+    HeartBeat,
+    KeyValuePair,
     Message,
+    NodeAddress,
+    NodeEvent,
+    NodeMeta,
+    RendezvousState,
+    Shard,
+    Task,
     addr_connected,
+    build_channel,
+    close_channel,
     deserialize_message,
     find_free_port,
     find_free_port_in_range,
     find_free_port_in_set,
+    parse_host_port,
 )
 
 
@@ -53,15 +80,178 @@ class GRPCUtilTest(unittest.TestCase):
         self.assertFalse(connected)
         connected = addr_connected("localhost:80")
         self.assertFalse(connected)
+        self.assertFalse(addr_connected("localhost"))
+        self.assertFalse(addr_connected("localhost:port"))
+
+        with socket.socket(socket.AF_INET6, socket.SOCK_STREAM) as s:
+            s.bind(("::1", 0))
+            s.listen()
+            port = s.getsockname()[1]
+            self.assertTrue(addr_connected(f"[::1]:{port}"))
+
+    def test_parse_host_port(self):
+        self.assertEqual(parse_host_port("localhost:80"), ("localhost", 80))
+        self.assertEqual(parse_host_port("[::1]:5000"), ("::1", 5000))
+        self.assertEqual(parse_host_port("localhost"), ("localhost", None))
+        self.assertEqual(parse_host_port("localhost:port"), (None, None))
+
+    def test_build_channel(self):
+        self.assertIsNone(build_channel("localhost:80"))
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+        port = server.add_insecure_port("localhost:0")
+        server.start()
+        addr = f"localhost:{port}"
+        channel = build_channel(addr)
+        self.assertIs(build_channel(addr), channel)
+
+        # The channel is still available for other clients.
+        close_channel(channel)
+        rpc = channel.unary_unary("/test/Unknown")
+        with self.assertRaises(grpc.RpcError) as ctx:
+            rpc(b"", timeout=TIMEOUT_SEC)
+        self.assertEqual(ctx.exception.code(), grpc.StatusCode.UNIMPLEMENTED)
+        close_channel(channel)
+        with self.assertRaises(ValueError):
+            rpc(b"", timeout=TIMEOUT_SEC)
+        new_channel = build_channel(addr)
+        self.assertIsNot(new_channel, channel)
+
+        # The stale channel is not reused if the server is stopped.
+        server.stop(None)
+        self.assertIsNone(build_channel(addr))
+        close_channel(new_channel)
+
+    def test_grpc_service_config(self):
+        options = dict(_GRPC_CHANNEL_OPTIONS)
+        config = json.loads(options["grpc.service_config"])
+        method_config = config["methodConfig"][0]
+        self.assertEqual(method_config["name"], [{}])
+        self.assertEqual(
+            method_config["retryPolicy"],
+            {
+                "maxAttempts": 5,
+                "initialBackoff": "0.2s",
+                "maxBackoff": "3s",
+                "backoffMultiplier": 2,
+                "retryableStatusCodes": ["UNAVAILABLE"],
+            },
+        )
 
     def test_deserialize_message(self):
         message = Message()
         message_bytes = message.serialize()
+        # The second byte of pickle data is the protocol version.
+        self.assertEqual(message_bytes[1], 5)
         de_message = deserialize_message(message_bytes)
         self.assertTrue(isinstance(de_message, Message))
         de_message = deserialize_message(b"")
         self.assertIsNone(de_message)
 
+        indices = array.array("q", [1, 2])
+        message = Task(shard=Shard(name="test", indices=indices))
+        de_message = deserialize_message(message.serialize())
+        self.assertEqual(de_message, message)
+        de_message = deserialize_message(pickle.dumps(KeyValuePair))
+        self.assertIs(de_message, KeyValuePair)
+
+        # Only the messages and builtin types can be loaded.
+        self.assertIsNone(deserialize_message(pickle.dumps(socket.socket)))
+        self.assertIsNone(deserialize_message(pickle.dumps(os.getcwd)))
+
+    def test_message_slots(self):
+        for message in [Task(), NodeEvent(), NodeAddress(id=1)]:
+            self.assertFalse(hasattr(message, "__dict__"))
+            de_message = deserialize_message(message.serialize())
+            self.assertEqual(de_message, message)
+        content = json.loads(NodeEvent().to_json())
+        self.assertEqual(content["node"]["id"], 0)
+
+    def test_message_reduce(self):
+        message = NodeAddress(type="worker", id=1)
+        cls, values = message.__reduce__()
+        self.assertIs(cls, NodeAddress)
+        self.assertEqual(cls(*values), message)
+        self.assertEqual(Message().__reduce__(), (Message, ()))
+
+    def test_load_message_without_reduce(self):
+        # The pickle data of `HeartBeat(timestamp=10)` from the message
+        # whose state is the `__dict__`.
+        data = (
+            b"\x80\x04\x95A\x00\x00\x00\x00\x00\x00\x00\x8c\x1a"
+            b"dlrover.python.common.grpc\x94\x8c\tHeartBeat\x94\x93\x94)"
+            b"\x81\x94}\x94\x8c\ttimestamp\x94K\nsb."
+        )
+        self.assertEqual(deserialize_message(data), HeartBeat(timestamp=10))
+
+        message = NodeMeta.__new__(NodeMeta)
+        message.__setstate__((None, {"type": "worker", "addr": "addr"}))
+        self.assertEqual(message.type, "worker")
+        self.assertEqual(message.addr, "addr")
+        message = NodeMeta.__new__(NodeMeta)
+        message.__setstate__({"type": "ps", "cpu": 1.0})
+        self.assertEqual(message.type, "ps")
+        self.assertEqual(message.cpu, 1.0)
+
+    def test_message_to_dict(self):
+        self.assertEqual(Message().to_dict(), {})
+        message = KeyValuePair(key="test", value=b"value")
+        self.assertEqual(message.to_dict(), {"key": "test", "value": b"value"})
+        message = NodeAddress(type="worker", id=1)
+        self.assertEqual(message.to_dict()["type"], "worker")
+        self.assertEqual(message.to_dict()["id"], 1)
+        self.assertEqual(len(message.to_dict()), 9)
+
+    def test_message_to_json(self):
+        message = KeyValuePair(key="test", value=b"\x00dlrover")
+        content = json.loads(message.to_json())
+        self.assertEqual(content["key"], "test")
+        value = base64.b64decode(content["value"])
+        self.assertEqual(value, b"\x00dlrover")
+
+        shard = Shard(name="test", indices=array.array("q", [1, 2]))
+        content = json.loads(shard.to_json())
+        self.assertListEqual(content["indices"], [1, 2])
+
+    @unittest.skipUnless(serialize.orjson, "orjson is not installed.")
+    def test_message_to_json_by_orjson(self):
+        message = RendezvousState(world={0: 8, 1: 8}, round=1)
+        with mock.patch.object(
+            serialize.orjson, "dumps", wraps=serialize.orjson.dumps
+        ) as mock_dumps:
+            json_str = message.to_json()
+        mock_dumps.assert_called_once()
+        with mock.patch.object(serialize, "orjson", None):
+            self.assertEqual(
+                json.loads(message.to_json()), json.loads(json_str)
+            )
+        content = json.loads(json_str)
+        self.assertEqual(content["world"], {"0": 8, "1": 8})
+        self.assertEqual(content["round"], 1)
+
+        message = RendezvousState(waiting_num=2**65)
+        content = json.loads(message.to_json())
+        self.assertEqual(content["waiting_num"], 2**65)
+
+    def test_base64_module(self):
+        fake_pybase64 = types.ModuleType("pybase64")
+        fake_pybase64.b64encode = mock.MagicMock(return_value=b"ZmFrZQ==")
+        message = KeyValuePair(key="test", value=b"fake")
+        with mock.patch.object(serialize, "base64", fake_pybase64):
+            content = json.loads(message.to_json())
+        fake_pybase64.b64encode.assert_called_once_with(b"fake")
+        self.assertEqual(content["value"], "ZmFrZQ==")
+
+        # Fall back to the stdlib if pybase64 is not installed. Import
+        # the module in a new process to keep the classes of this one.
+        code = (
+            "import sys; sys.modules['pybase64'] = None; "
+            "import base64; "
+            "from dlrover.python.common import serialize; "
+            "assert serialize.base64 is base64"
+        )
+        root_dir = os.path.dirname(dlrover.__path__[0])
+        subprocess.run([sys.executable, "-c", code], cwd=root_dir, check=True)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,8 @@
 # limitations under the License.
 
 
+import threading
+import time
 import unittest
 from datetime import datetime, timedelta
 from unittest import mock
@@ -143,6 +145,25 @@ class AllreduceAutoScalerTest(unittest.TestCase):
         )
         alive_num = auto_scaler._get_alive_worker_num()
         self.assertEqual(alive_num, 16)
+
+        auto_scaler._scale_interval = 0.1
+        self.assertFalse(auto_scaler._wait_for_wakeup())
+        auto_scaler._scale_interval = 60
+        threading.Timer(0.1, auto_scaler.notify_node_changed).start()
+        start = time.time()
+        self.assertTrue(auto_scaler._wait_for_wakeup())
+        self.assertLess(time.time() - start, 30)
+        self.assertFalse(auto_scaler._wakeup_event.is_set())
+
+        # The auto-scaling thread exits once auto-scaling stops.
+        auto_scaler._autoscaling_started = True
+        thread = threading.Thread(
+            target=auto_scaler._periodic_adjust_worker, daemon=True
+        )
+        thread.start()
+        auto_scaler.stop_auto_scaling()
+        thread.join(timeout=30)
+        self.assertFalse(thread.is_alive())
         auto_scaler.start_auto_scaling()
         self.assertTrue(auto_scaler._autoscaling_started)
         auto_scaler.stop_auto_scaling()
@@ -36,7 +36,10 @@ from dlrover.python.common.node import NodeGroupResource, NodeResource
 from dlrover.python.master.dist_master import DistributedJobMaster
 from dlrover.python.master.monitor.error_monitor import SimpleErrorMonitor
 from dlrover.python.master.monitor.speed_monitor import SpeedMonitor
-from dlrover.python.master.node.dist_job_manager import create_job_manager
+from dlrover.python.master.node.dist_job_manager import (
+    _get_watch_retry_interval,
+    create_job_manager,
+)
 from dlrover.python.master.node.event_callback import (
     ClusterContext,
     TaskRescheduleCallback,
@@ -79,31 +82,71 @@ class NodeStatusFlowTest(unittest.TestCase):
         flow: NodeStateFlow = get_node_state_flow(
             NodeStatus.PENDING, NodeEventType.MODIFIED, NodeStatus.RUNNING
         )
-        self.assertEqual(flow, NODE_STATE_FLOWS[4])
+        self.assertIs(flow, NODE_STATE_FLOWS[4])
 
         flow = get_node_state_flow(
             NodeStatus.RUNNING, NodeEventType.MODIFIED, NodeStatus.SUCCEEDED
         )
-        self.assertEqual(flow, NODE_STATE_FLOWS[7])
+        self.assertIs(flow, NODE_STATE_FLOWS[7])
 
         flow = get_node_state_flow(
             NodeStatus.RUNNING, NodeEventType.DELETED, NodeStatus.DELETED
         )
-        self.assertEqual(flow, NODE_STATE_FLOWS[10])
+        self.assertIs(flow, NODE_STATE_FLOWS[10])
         self.assertTrue(flow.should_relaunch)
 
         flow = get_node_state_flow(
             NodeStatus.SUCCEEDED, NodeEventType.DELETED, NodeStatus.DELETED
         )
-        self.assertEqual(flow, NODE_STATE_FLOWS[-2])
+        self.assertIs(flow, NODE_STATE_FLOWS[-2])
         self.assertFalse(flow.should_relaunch)
 
         flow = get_node_state_flow(
             NodeStatus.PENDING, NodeEventType.DELETED, NodeStatus.DELETED
         )
-        self.assertEqual(flow, NODE_STATE_FLOWS[9])
+        self.assertIs(flow, NODE_STATE_FLOWS[9])
         self.assertTrue(flow.should_relaunch)
 
+    def test_get_node_state_flow_by_table(self):
+        def scan_node_state_flow(from_status, event_type, phase):
+            for flow in NODE_STATE_FLOWS:
+                if (
+                    from_status == flow.from_status
+                    and event_type in flow.event_type
+                    and (flow.phase is None or phase == flow.phase)
+                ):
+                    return flow
+            return None
+
+        statuses = [
+            NodeStatus.INITIAL,
+            NodeStatus.PENDING,
+            NodeStatus.RUNNING,
+            NodeStatus.SUCCEEDED,
+            NodeStatus.FAILED,
+            NodeStatus.DELETED,
+            NodeStatus.UNKNOWN,
+        ]
+        event_types = [
+            NodeEventType.ADDED,
+            NodeEventType.MODIFIED,
+            NodeEventType.DELETED,
+        ]
+        for from_status in statuses:
+            for event_type in event_types:
+                for phase in statuses:
+                    if from_status == phase:
+                        continue
+                    if (
+                        event_type == NodeEventType.DELETED
+                        and from_status == NodeStatus.PENDING
+                    ):
+                        continue
+                    self.assertEqual(
+                        get_node_state_flow(from_status, event_type, phase),
+                        scan_node_state_flow(from_status, event_type, phase),
+                    )
+
 
 class DistributedJobManagerTest(unittest.TestCase):
     def setUp(self) -> None:
@@ -130,6 +173,17 @@ class DistributedJobManagerTest(unittest.TestCase):
         self.assertEqual(job.worker_num, 5)
         self.assertEqual(job.ps_num, 3)
 
+        group_resource = job.update_node_group_resource(
+            NodeType.WORKER, 6, 0, 8192
+        )
+        self.assertIs(
+            group_resource, job.get_node_group_resource(NodeType.WORKER)
+        )
+        self.assertEqual(group_resource.count, 6)
+        self.assertEqual(group_resource.node_resource.cpu, 1)
+        self.assertEqual(group_resource.node_resource.memory, 8192)
+        job.update_node_group_resource(NodeType.WORKER, 5, 0, 4096)
+
         nodes = job.init_job_node_meta(1, get_service_fn, _get_node_name)
         self.assertEqual(len(nodes[NodeType.WORKER]), 5)
         self.assertEqual(len(nodes[NodeType.PS]), 3)
@@ -174,8 +228,9 @@ class DistributedJobManagerTest(unittest.TestCase):
         )
 
         nodes = job.init_job_node_meta(1, get_service_fn, _get_node_name)
+        # The index 8 is beyond the number of workers.
         set_critical_node(
-            nodes, ps_relaunch_max_num=2, critical_worker_index={0: 3}
+            nodes, ps_relaunch_max_num=2, critical_worker_index={0: 3, 8: 1}
         )
         self.assertTrue(nodes[NodeType.PS][0].critical)
         self.assertEqual(nodes[NodeType.PS][0].max_relaunch_count, 2)
@@ -242,24 +297,98 @@ class DistributedJobManagerTest(unittest.TestCase):
         self.assertEqual(
             manager._job_nodes[NodeType.WORKER][1].status, NodeStatus.RUNNING
         )
-        should_relaunch = manager._should_relaunch(node, NODE_STATE_FLOWS[5])
-        self.assertFalse(should_relaunch)
-
-        should_relaunch = manager._should_relaunch(node, NODE_STATE_FLOWS[6])
-        self.assertTrue(should_relaunch)
-
-        node.relaunch_count = node.max_relaunch_count + 1
-        should_relaunch = manager._should_relaunch(node, NODE_STATE_FLOWS[6])
-        self.assertFalse(should_relaunch)
-
-        node.exit_reason = NodeExitReason.FATAL_ERROR
-        should_relaunch = manager._should_relaunch(node, NODE_STATE_FLOWS[6])
-        self.assertFalse(should_relaunch)
 
         manager.handle_training_failure(
             NodeType.WORKER, 0, level=TrainingExceptionLevel.NODE_ERROR
         )
 
+    def test_should_relaunch(self):
+        params = MockK8sPSJobArgs()
+        params.initilize()
+        manager = create_job_manager(params, SpeedMonitor())
+        manager._init_nodes()
+        cases = [
+            (5, 0, None, False),
+            (6, 0, None, True),
+            (6, 2, None, False),
+            (6, 0, NodeExitReason.FATAL_ERROR, False),
+        ]
+        for flow_index, relaunch_count, exit_reason, expected in cases:
+            with self.subTest(
+                flow_index=flow_index,
+                relaunch_count=relaunch_count,
+                exit_reason=exit_reason,
+            ):
+                node = Node(
+                    node_type=NodeType.WORKER,
+                    node_id=1,
+                    status=NodeStatus.RUNNING,
+                    config_resource=NodeResource(1, 4096),
+                    max_relaunch_count=1,
+                )
+                node.relaunch_count = relaunch_count
+                node.exit_reason = exit_reason
+                should_relaunch = manager._should_relaunch(
+                    node, NODE_STATE_FLOWS[flow_index]
+                )
+                self.assertEqual(should_relaunch, expected)
+
+    def test_process_node_events_out_of_lock(self):
+        params = MockK8sPSJobArgs()
+        params.initilize()
+        manager = create_job_manager(params, SpeedMonitor())
+        manager._init_nodes()
+        callback = mock.MagicMock()
+        callback.on_node_started.side_effect = lambda *args: self.assertFalse(
+            manager._lock.locked()
+        )
+        manager.add_node_event_callback(callback)
+        node = Node(
+            node_type=NodeType.WORKER,
+            node_id=0,
+            status=NodeStatus.RUNNING,
+            config_resource=NodeResource(1, 4096),
+        )
+        manager._process_event(NodeEvent(NodeEventType.MODIFIED, node))
+        self.assertEqual(
+            manager._job_nodes[NodeType.WORKER][0].status, NodeStatus.RUNNING
+        )
+        callback.on_node_started.assert_called_once()
+
+    def test_notify_auto_scaler_after_relaunch(self):
+        params = MockK8sPSJobArgs()
+        params.initilize()
+        manager = create_job_manager(params, SpeedMonitor())
+        manager._init_nodes()
+        manager._job_nodes[NodeType.WORKER][0].status = NodeStatus.RUNNING
+        calls = mock.Mock()
+        manager._job_autoscaler = calls.auto_scaler
+        manager._relaunch_node = calls.relaunch_node
+        node = Node(
+            node_type=NodeType.WORKER,
+            node_id=0,
+            status=NodeStatus.FAILED,
+            config_resource=NodeResource(1, 4096),
+        )
+        manager._process_event(NodeEvent(NodeEventType.MODIFIED, node))
+        self.assertEqual(
+            calls.mock_calls,
+            [
+                mock.call.relaunch_node(
+                    manager._job_nodes[NodeType.WORKER][0]
+                ),
+                mock.call.auto_scaler.notify_node_changed(),
+            ],
+        )
+
+    def test_get_watch_retry_interval(self):
+        interval = _get_watch_retry_interval(1)
+        self.assertTrue(10 <= interval < 11)
+        interval = _get_watch_retry_interval(3)
+        self.assertTrue(40 <= interval < 41)
+        interval = _get_watch_retry_interval(100)
+        self.assertTrue(300 <= interval < 301)
+
     def test_get_dead_node_event(self):
         params = MockK8sPSJobArgs()
         params.initilize()
@@ -315,6 +444,16 @@ class DistributedJobManagerTest(unittest.TestCase):
         ps_ids = list(manager._job_nodes[NodeType.PS].keys())
         self.assertListEqual(ps_ids, [0, 1, 2, 3])
 
+        # The unchanged nodes are skipped.
+        manager._process_event = mock.MagicMock()
+        manager._process_list_nodes(nodes)
+        manager._process_event.assert_not_called()
+        nodes[1].status = NodeStatus.FAILED
+        manager._process_list_nodes(nodes)
+        self.assertEqual(manager._process_event.call_count, 1)
+        event = manager._process_event.call_args[0][0]
+        self.assertEqual(event.node.id, 1)
+
     def test_create_allreduce_job_manager(self):
         params = MockK8sPSJobArgs()
         params.initilize()
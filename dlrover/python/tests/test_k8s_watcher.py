@@ -91,6 +91,7 @@ class PodWatcherTest(unittest.TestCase):
         self.assertEqual(node_event.node.type, NodeType.WORKER)
         self.assertEqual(node_event.node.config_resource.cpu, 1)
         self.assertEqual(node_event.node.config_resource.memory, 10240)
+        self.assertFalse(hasattr(node_event, "__dict__"))
 
     def test_convert_pod_deleted_event_to_node_event_with_existed_running_pod(
         self,
@@ -28,8 +28,8 @@ from dlrover.python.tests.test_utils import start_local_master
 
 class MasterClientTest(unittest.TestCase):
     def setUp(self) -> None:
-        self._master, addr = start_local_master()
-        self._master_client = build_master_client(addr, 0.5)
+        self._master, self._addr = start_local_master()
+        self._master_client = build_master_client(self._addr, 0.5)
 
     def tearDown(self):
         self._master.stop()
@@ -39,6 +39,17 @@ class MasterClientTest(unittest.TestCase):
         self._master_client.close_channel()
         self._master_client.open_channel()
 
+    def test_close_shared_channel(self):
+        client = build_master_client(self._addr, 0.5)
+        self.assertIs(client._channel, self._master_client._channel)
+        client.close_channel()
+        self.assertIsNone(client._channel)
+        res = self._master_client.report_failures(
+            "test", 0, TrainingExceptionLevel.WARNING
+        )
+        self.assertIsNone(res)
+        self.assertTrue(grpc.grpc_server_ready(self._master_client._channel))
+
     def test_report_used_resource(self):
         gpu_stats: list[grpc.GPUStats] = [
             grpc.GPUStats(
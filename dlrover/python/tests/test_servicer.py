@@ -124,6 +124,26 @@ class MasterServicerTest(unittest.TestCase):
         self.assertLessEqual(10, len(checkpoint.content))
         self.servicer._restore_shard_checkpoint(checkpoint)
 
+    def test_shuffled_dataset_service(self):
+        request = grpc.DatasetShardParams(
+            batch_size=10,
+            num_epochs=1,
+            dataset_size=1000,
+            shuffle=True,
+            num_minibatches_per_shard=10,
+            dataset_name="test",
+            task_type=elastic_training_pb2.TRAINING,
+            storage_type="text",
+        )
+        self.servicer._collect_dataset_shard_params(request)
+        request = grpc.TaskRequest("test")
+        task: grpc.Task = self.servicer._get_task(NodeType.WORKER, 0, request)
+        self.assertEqual(task.shard.indices.typecode, "i")
+        self.assertEqual(len(task.shard.indices), 100)
+        task = grpc.deserialize_message(task.serialize())
+        self.assertEqual(len(task.shard.indices), 100)
+        self.assertTrue(all(0 <= i < 1000 for i in task.shard.indices))
+
     def test_metric_service(self):
         self.job_manager._init_nodes()
         self.job_manager._init_job_auto_scaler()
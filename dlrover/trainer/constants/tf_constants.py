@@ -38,13 +38,12 @@ class TFConstants(object):
     EvalSet = Constant("eval_set")
     LogSteps = Constant("log_steps", 100)
 
-    BatchSize = Constant("log_steps", 64)
+    BatchSize = Constant("batch_size", 64)
     EstimatorTrainingChiefHooks = Constant("training_chief_hooks")
     EstimatorTrainingHooks = Constant("training_hooks")
     EstimatorPredictionHooks = Constant("prediction_hooks")
     EstimatorEvaluationHooks = Constant("evaluation_hooks")
     Epoch = Constant("epoch", 1)
-    LogSteps = Constant("log_steps", 100)
     # CheckpointSaverHook
     SaveSteps = Constant("save_steps", 100)
     SaveSecs = Constant("save_secs", None)
@@ -58,10 +57,6 @@ class TFConstants(object):
     EvalMaxSecs = Constant("eval_max_secs", 3600 * 24 * 5)
     ModelDir = Constant("model_dir")
     ANY_NODE_FO_LEVEL = Constant(1)
-    EstimatorTrainingChiefHooks = Constant("training_chief_hooks")
-    EstimatorTrainingHooks = Constant("training_hooks")
-    EstimatorPredictionHooks = Constant("prediction_hooks")
-    EstimatorEvaluationHooks = Constant("evaluation_hooks")
     EnableAutoScaling = Constant("enable_auto_scaling")
     EnableDynamicSharding = Constant("enable_dynamic_sharding", True)
     EnableIncrSavedModel = Constant("enable_incr_saved_model", False)
@@ -18,7 +18,10 @@ pip install psutil
 pip install deprecated
 pip install 'ray[default]'
 pip install pyhocon
+pip install orjson
+pip install pybase64
 pip install pytest-cov
+pip install pytest-xdist
 pip install tensorflow==2.13.0
 pip install deepspeed==0.12.6
 pip install accelerate==0.29.2
@@ -27,6 +27,7 @@ extra_require = {
     "ray": ["ray"],
     "tensorflow": ["tensorflow"],
     "torch": ["torch"],
+    "speedup": ["orjson", "pybase64"],
 }
 
 